@@ -0,0 +1,100 @@
+"""
+Content-addressed cache for deterministic EigenAI responses.
+
+EigenAI returns bit-identical output for the same model + messages + seed at
+temperature 0, so a response only ever needs to be fetched once. Responses
+are keyed by SHA256 over the canonical request and kept in two tiers:
+an in-memory LRU and one JSON file per key under cache/{key[:2]}/{key}.json.
+"""
+
+import json
+import hashlib
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import Optional
+
+
+class LLMCache:
+    """Memory LRU in front of an on-disk JSON store."""
+
+    def __init__(self, cache_dir: Optional[str] = "cache", max_entries: int = 256):
+        self.cache_dir = cache_dir
+        self.max_entries = max_entries
+        self._memory: "OrderedDict[str, dict]" = OrderedDict()
+        # Verification re-executes on worker threads; guards the LRU
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(
+        model: str,
+        messages: list,
+        seed: int,
+        temperature: float,
+        max_tokens: int,
+        n: int = 1,
+    ) -> str:
+        request = {
+            "model": model,
+            "messages": messages,
+            "seed": seed,
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+        }
+        # Single-choice keys predate `n`; leave them unchanged
+        if n != 1:
+            request["n"] = n
+        canonical = json.dumps(request, sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(canonical.encode()).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key[:2], f"{key}.json")
+
+    def get(self, key: str) -> Optional[dict]:
+        with self._lock:
+            value = self._memory.get(key)
+            if value is not None:
+                self._memory.move_to_end(key)
+                return value
+
+        if not self.cache_dir:
+            return None
+        try:
+            with open(self._path(key), encoding="utf-8") as f:
+                value = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return None
+
+        self._remember(key, value)
+        return value
+
+    def set(self, key: str, value: dict):
+        self._remember(key, value)
+        if not self.cache_dir:
+            return
+
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Write-then-rename so a concurrent reader never sees a partial file.
+        # mkstemp gives every writer (process or thread) its own temp file.
+        fd, tmp_path = tempfile.mkstemp(
+            dir=os.path.dirname(path), prefix=f"{key}.", suffix=".tmp"
+        )
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(value, f, ensure_ascii=False)
+            os.replace(tmp_path, path)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+
+    def _remember(self, key: str, value: dict):
+        with self._lock:
+            self._memory[key] = value
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.max_entries:
+                self._memory.popitem(last=False)
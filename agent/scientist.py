@@ -8,21 +8,114 @@ Same prompt + same seed + same model = same output. Always.
 Auth: Uses deTERMinal grant-based wallet signature authentication.
 """
 
+import os
 import json
+import asyncio
 import hashlib
 import time
 import re
+import uuid
+import httpx
+import orjson
 import requests
+from aiolimiter import AsyncLimiter
+from requests.adapters import HTTPAdapter
+from tenacity import (
+    retry,
+    retry_if_exception,
+    stop_after_attempt,
+    wait_exponential,
+    wait_random,
+)
 from eth_account import Account
 from eth_account.messages import encode_defunct
-from dataclasses import dataclass, asdict
-from typing import List, Optional, Callable
+from dataclasses import dataclass, asdict, fields
+from collections import deque
+from contextlib import nullcontext
+from concurrent.futures import ThreadPoolExecutor
+from typing import AsyncIterator, Callable, Deque, Optional
+
+from agent.llm_cache import LLMCache
 
 
 DETERMINAL_API = "https://determinal-api.eigenarcade.com"
 
+# Entries kept in memory for the live dashboard; the full trail is on disk
+AUDIT_MEMORY_LIMIT = 200
+
+# Per-step generation budgets. max_tokens is part of the request, so it is
+# recorded on every audit entry and reused by verify_step.
+MAX_TOKENS = {
+    "generate_hypotheses": 2048,
+    "assess_novelty": 512,
+    "design_experiment": 1024,
+    "generate_code": 4096,
+    "analyze_results": 768,
+    "write_abstract": 512,
+    "run_pipeline_fast": 8192,
+}
+DEFAULT_MAX_TOKENS = 4096
+
+# Stand-in experiment results until real execution runs in the TEE
+SIMULATED_RESULTS = {
+    "baseline": {"mean_reward": 145.3, "std": 12.1, "success_rate": 0.72},
+    "proposed": {"mean_reward": 178.9, "std": 9.8, "success_rate": 0.84},
+    "improvement": "+23.1% reward, +16.7% success rate",
+    "statistical_test": "p < 0.01 (Welch's t-test)",
+    "note": "Simulated for demo. Real execution runs in EigenCompute TEE.",
+}
+
+# Fast path: which keys of the single-generation output belong to which milestone
+FAST_PATH_SECTIONS = {
+    "M1_IDEATION": "hypotheses,novelty,selected_index",
+    "M2_DESIGN": "experiment,code",
+    "M3_ANALYSIS": "analysis",
+    "M4_WRITING": "abstract",
+}
+
+# Multi-draft sampling. At temperature 0 every choice would be the same greedy
+# decode, so drafts sample — still reproducible, because the seed is pinned.
+DRAFT_TEMPERATURE = 0.7
+
+# Harmony-format tokens emitted by gpt-oss. Compiled once; applied to every output.
+_CHANNEL_RE = re.compile(r"<\|channel\|>\s*analysis\s*<\|message\|>.*?<\|end\|>", re.DOTALL)
+_TOKEN_RE = re.compile(r"<\|[^|]*\|>")
+_JSON_START_RE = re.compile(r"[\[{]")
+
+
+def _sha256_hex(data: str | bytes) -> str:
+    """
+    Hex SHA256 of raw bytes or UTF-8 text — the hash used for every audit entry.
+
+    hashlib.sha256 is OpenSSL's EVP implementation whenever Python is linked
+    against OpenSSL (as the python:3.11 image is), which dispatches to SHA-NI
+    on x86_64 and the ARMv8 SHA extensions on aarch64.
+    """
+    h = hashlib.sha256()
+    h.update(data.encode("utf-8") if isinstance(data, str) else data)
+    return h.hexdigest()
+
 
-@dataclass
+def _is_transient(exc: BaseException) -> bool:
+    """Timeouts, dropped connections, 429 and 5xx are retried; other 4xx fail fast."""
+    if isinstance(exc, (requests.Timeout, requests.ConnectionError, httpx.TransportError)):
+        return True
+    response = getattr(exc, "response", None)
+    if isinstance(exc, (requests.HTTPError, httpx.HTTPStatusError)) and response is not None:
+        return response.status_code == 429 or response.status_code >= 500
+    return False
+
+
+# EigenAI is mainnet alpha: back off 1, 2, 4, 8s (+ up to 1s jitter) over 5 attempts
+_retry_transient = retry(
+    stop=stop_after_attempt(5),
+    wait=wait_exponential(multiplier=1, min=1, max=16) + wait_random(0, 1),
+    retry=retry_if_exception(_is_transient),
+    reraise=True,
+)
+
+
+@dataclass(slots=True)
 class AuditEntry:
     step_id: str
     timestamp: float
@@ -30,13 +123,27 @@ class AuditEntry:
     action: str
     prompt_hash: str
     output_hash: str
-    output_preview: str
     model: str
     seed: int
     full_prompt: str = ""
     full_output: str = ""
     verified: bool = False
     verification_match: Optional[bool] = None
+    # Sampling parameters, needed to re-execute the step exactly
+    max_tokens: int = DEFAULT_MAX_TOKENS
+    temperature: float = 0.0
+    n: int = 1
+    choice_index: int = 0
+    # Fast path only: keys of the full output this entry covers
+    section: str = ""
+
+    @property
+    def output_preview(self) -> str:
+        return self.full_output[:300]
+
+
+# Tolerate older JSONL lines that carry fields since removed (output_preview)
+_AUDIT_FIELDS = {f.name for f in fields(AuditEntry)}
 
 
 class EigenAIClient:
@@ -47,19 +154,39 @@ class EigenAIClient:
     1. Fetch grant message from deTERMinal
     2. Sign with wallet private key
     3. Include signature in every API request
+
+    Temperature-0 completions are deterministic, so they are served from
+    the optional LLMCache when the exact same request was made before.
     """
 
-    def __init__(self, wallet_address: str, private_key: str):
+    # Whether the API honours `n`. Process-wide (the API is the same for
+    # every client); None until the first multi-draft call finds out.
+    supports_n: Optional[bool] = None
+
+    def __init__(
+        self,
+        wallet_address: str,
+        private_key: str,
+        cache: Optional[LLMCache] = None,
+    ):
         self.wallet_address = wallet_address
         self.private_key = private_key
+        self.cache = cache
         self.grant_message = None
         self.grant_signature = None
+        # One pooled keep-alive session: every call after the first reuses
+        # the open TLS connection instead of paying a new handshake.
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=16, max_retries=0)
+        self.session.mount("https://", adapter)
+        self._async_http: Optional[httpx.AsyncClient] = None
+        self._async_loop: Optional[asyncio.AbstractEventLoop] = None
         self._authenticate()
 
     def _authenticate(self):
         """Fetch grant message and sign it."""
         # Step 1: Get the grant message
-        resp = requests.get(
+        resp = self.session.get(
             f"{DETERMINAL_API}/message",
             params={"address": self.wallet_address},
             timeout=15,
@@ -79,15 +206,38 @@ class EigenAIClient:
         if not self.grant_signature.startswith("0x"):
             self.grant_signature = "0x" + self.grant_signature
 
-    def chat_completion(
+    def _cache_lookup(
         self,
         model: str,
         messages: list,
-        seed: int = 42,
-        temperature: float = 0.0,
-        max_tokens: int = 4096,
+        seed: int,
+        temperature: float,
+        max_tokens: int,
+        force_refresh: bool,
+        n: int = 1,
+    ) -> tuple[Optional[str], Optional[dict]]:
+        """Return (cache_key, cached_response). The key is None when uncacheable."""
+        if self.cache is None or temperature != 0.0:
+            return None, None
+        cache_key = LLMCache.make_key(model, messages, seed, temperature, max_tokens, n)
+        if force_refresh:
+            return cache_key, None
+        return cache_key, self.cache.get(cache_key)
+
+    def _cache_store(self, cache_key: Optional[str], data: dict):
+        # Only cache real completions, never error envelopes
+        if cache_key is not None and data.get("choices"):
+            self.cache.set(cache_key, data)
+
+    def _completion_payload(
+        self,
+        model: str,
+        messages: list,
+        seed: int,
+        temperature: float,
+        max_tokens: int,
+        n: int = 1,
     ) -> dict:
-        """Make a chat completion request via deTERMinal grant auth."""
         payload = {
             "model": model,
             "messages": messages,
@@ -99,8 +249,43 @@ class EigenAIClient:
             "grantSignature": self.grant_signature,
             "walletAddress": self.wallet_address,
         }
+        # OpenAI-style multi-choice sampling; omitted for the common n=1 case
+        if n > 1:
+            payload["n"] = n
+        return payload
+
+    def chat_completion(
+        self,
+        model: str,
+        messages: list,
+        seed: int = 42,
+        temperature: float = 0.0,
+        max_tokens: int = 4096,
+        force_refresh: bool = False,
+        n: int = 1,
+    ) -> dict:
+        """
+        Make a chat completion request via deTERMinal grant auth.
+
+        force_refresh skips the cache lookup (the fresh response still
+        replaces the cached one) — used when re-checking determinism.
+        n > 1 asks for that many choices in one generation.
+        """
+        cache_key, cached = self._cache_lookup(
+            model, messages, seed, temperature, max_tokens, force_refresh, n
+        )
+        if cached is not None:
+            return cached
 
-        resp = requests.post(
+        data = self._post_completion(
+            self._completion_payload(model, messages, seed, temperature, max_tokens, n)
+        )
+        self._cache_store(cache_key, data)
+        return data
+
+    @_retry_transient
+    def _post_completion(self, payload: dict) -> dict:
+        resp = self.session.post(
             f"{DETERMINAL_API}/api/chat/completions",
             headers={"Content-Type": "application/json"},
             json=payload,
@@ -109,9 +294,171 @@ class EigenAIClient:
         resp.raise_for_status()
         return resp.json()
 
+    def _get_async_http(self) -> httpx.AsyncClient:
+        """
+        Shared pooled AsyncClient. One per event loop — httpx connections are
+        bound to the loop that opened them, so a new loop gets a new pool.
+        """
+        loop = asyncio.get_running_loop()
+        if self._async_http is None or self._async_loop is not loop:
+            self._async_http = httpx.AsyncClient(
+                limits=httpx.Limits(max_connections=16),
+                timeout=120,
+            )
+            self._async_loop = loop
+        return self._async_http
+
+    async def achat_completion(
+        self,
+        model: str,
+        messages: list,
+        seed: int = 42,
+        temperature: float = 0.0,
+        max_tokens: int = 4096,
+        force_refresh: bool = False,
+        n: int = 1,
+        limiter: Optional[AsyncLimiter] = None,
+    ) -> dict:
+        """
+        Async chat_completion() over the shared httpx pool. A `limiter`
+        throttles each request that actually goes out (cache hits don't).
+        """
+        cache_key, cached = self._cache_lookup(
+            model, messages, seed, temperature, max_tokens, force_refresh, n
+        )
+        if cached is not None:
+            return cached
+
+        data = await self._apost_completion(
+            self._completion_payload(model, messages, seed, temperature, max_tokens, n),
+            limiter,
+        )
+        self._cache_store(cache_key, data)
+        return data
+
+    @_retry_transient
+    async def _apost_completion(
+        self, payload: dict, limiter: Optional[AsyncLimiter] = None
+    ) -> dict:
+        if limiter is not None:
+            await limiter.acquire()
+        resp = await self._get_async_http().post(
+            f"{DETERMINAL_API}/api/chat/completions",
+            headers={"Content-Type": "application/json"},
+            json=payload,
+        )
+        resp.raise_for_status()
+        return resp.json()
+
+    @_retry_transient
+    async def _aopen_stream(
+        self, payload: dict, limiter: Optional[AsyncLimiter] = None
+    ) -> httpx.Response:
+        """Open a streaming completion. Only the connect/status phase is retried."""
+        if limiter is not None:
+            await limiter.acquire()
+        http = self._get_async_http()
+        request = http.build_request(
+            "POST",
+            f"{DETERMINAL_API}/api/chat/completions",
+            headers={"Content-Type": "application/json"},
+            json=payload,
+        )
+        resp = await http.send(request, stream=True)
+        try:
+            resp.raise_for_status()
+        except httpx.HTTPStatusError:
+            await resp.aclose()
+            raise
+        return resp
+
+    async def achat_completion_stream(
+        self,
+        model: str,
+        messages: list,
+        seed: int = 42,
+        temperature: float = 0.0,
+        max_tokens: int = 4096,
+        limiter: Optional[AsyncLimiter] = None,
+    ) -> AsyncIterator[str]:
+        """
+        Streaming achat_completion(): yields content deltas as the server emits
+        them (SSE `data:` lines). The assembled text is cached like a normal
+        completion; a cache hit yields the whole text as a single chunk.
+        """
+        cache_key, cached = self._cache_lookup(
+            model, messages, seed, temperature, max_tokens, False
+        )
+        if cached is not None:
+            try:
+                yield cached["choices"][0]["message"]["content"] or ""
+            except (KeyError, IndexError):
+                yield str(cached)
+            return
+
+        payload = self._completion_payload(model, messages, seed, temperature, max_tokens)
+        payload["stream"] = True
+
+        parts = []
+        done = False
+        resp = await self._aopen_stream(payload, limiter)
+        try:
+            if resp.headers.get("content-type", "").startswith("application/json"):
+                # Server ignored "stream": true and sent a plain completion
+                await resp.aread()
+                data = resp.json()
+                try:
+                    content = data["choices"][0]["message"]["content"] or ""
+                except (KeyError, IndexError, TypeError):
+                    raise httpx.DecodingError(
+                        f"Unexpected completion body: {str(data)[:200]}",
+                        request=resp.request,
+                    )
+                if content:
+                    self._cache_store(cache_key, data)
+                    yield content
+                return
+
+            async for line in resp.aiter_lines():
+                if not line.startswith("data:"):
+                    continue
+                data = line[len("data:"):].strip()
+                if data == "[DONE]":
+                    done = True
+                    break
+                try:
+                    delta = json.loads(data)["choices"][0].get("delta", {})
+                except (json.JSONDecodeError, KeyError, IndexError):
+                    continue
+                chunk = delta.get("content")
+                if chunk:
+                    parts.append(chunk)
+                    yield chunk
+        finally:
+            await resp.aclose()
+
+        # Only a stream that ran to [DONE] is the complete, deterministic
+        # output; a cut-off or empty one must not be replayed from cache
+        if done and parts:
+            self._cache_store(
+                cache_key,
+                {"choices": [{"message": {"role": "assistant", "content": "".join(parts)}}]},
+            )
+
+    def close(self):
+        """Release pooled sync connections."""
+        self.session.close()
+
+    async def aclose(self):
+        """Close the async connection pool (must run on the loop that owns it)."""
+        if self._async_http is not None:
+            await self._async_http.aclose()
+            self._async_http = None
+            self._async_loop = None
+
     def check_grant(self) -> dict:
         """Check remaining token balance."""
-        resp = requests.get(
+        resp = self.session.get(
             f"{DETERMINAL_API}/checkGrant",
             params={"address": self.wallet_address},
             timeout=15,
@@ -126,7 +473,8 @@ class SovereignScientist:
 
     Architecture:
     - All LLM calls → EigenAI via deTERMinal (deterministic, verifiable)
-    - Every call is hashed and logged in an audit trail
+    - Every call is hashed and logged in an audit trail, written to
+      audit/{program_hash}/{run_id}.jsonl as it happens
     - Any step can be independently re-executed to verify correctness
     - Designed to run inside EigenCompute TEE for code integrity
     """
@@ -137,63 +485,205 @@ class SovereignScientist:
         private_key: str,
         model: str = "gpt-oss-120b-f16",
         seed: int = 42,
+        use_cache: bool = True,
+        cache_dir: Optional[str] = "cache",
+        audit_dir: str = "audit",
+        audit_namespace: Optional[str] = None,
+        client: Optional[EigenAIClient] = None,
+        run_id: Optional[str] = None,
+        verify_cache: Optional[dict] = None,
     ):
-        self.client = EigenAIClient(wallet_address, private_key)
+        if client is None:
+            cache = LLMCache(cache_dir) if use_cache else None
+            client = EigenAIClient(wallet_address, private_key, cache=cache)
+        self.client = client
         self.model = model
         self.seed = seed
-        self.audit_log: List[AuditEntry] = []
+        self.use_cache = use_cache
+        self.cache_dir = cache_dir
+        self.audit_log: Deque[AuditEntry] = deque(maxlen=AUDIT_MEMORY_LIMIT)
         self.step_counter = 0
+        self._audit_lock = asyncio.Lock()
+        # Separate runs (e.g. the topics of a batch) under audit/{namespace}/
+        self.audit_dir = (
+            os.path.join(audit_dir, audit_namespace) if audit_namespace else audit_dir
+        )
+        # Names this run's audit file; None = a fresh id per pipeline run
+        self.run_id = run_id
+        self.audit_path: Optional[str] = None
+        self._audit_fp = None
+        # Throttles this agent's API requests (see run_pipeline_many)
+        self.rate_limiter: Optional[AsyncLimiter] = None
+        # If set, called with every new AuditEntry (live dashboards)
+        self.on_entry: Optional[Callable[[AuditEntry], None]] = None
+        # Proofs of steps already re-executed with a matching hash
+        self._verify_path = (
+            os.path.join(cache_dir, "verify.jsonl") if use_cache and cache_dir else None
+        )
+        # Shared with spawn()ed agents, so the file is read once per family
+        self._verify_cache: dict[str, dict] = (
+            verify_cache if verify_cache is not None
+            else self._load_verify_cache() if use_cache else {}
+        )
+
+    def _open_audit(self, program_hash: str):
+        """
+        Start writing audit entries to audit/{program_hash}/{run_id}.jsonl.
+        One file per run: runs on the same topic never share (or interleave
+        into) a trail, and _find_entry only ever sees this run's entries.
+        """
+        self.close_audit()
+        run_dir = os.path.join(self.audit_dir, program_hash)
+        os.makedirs(run_dir, exist_ok=True)
+        run_id = self.run_id or uuid.uuid4().hex
+        self.audit_path = os.path.join(run_dir, f"{run_id}.jsonl")
+        # Line-buffered: every entry hits the file as soon as it is written
+        self._audit_fp = open(self.audit_path, "w", buffering=1, encoding="utf-8")
+
+    def _append_audit(self, entry: AuditEntry):
+        self.audit_log.append(entry)
+        if self._audit_fp is not None:
+            self._audit_fp.write(orjson.dumps(asdict(entry)).decode() + "\n")
+        if self.on_entry is not None:
+            self.on_entry(entry)
+
+    def _find_entry(self, step_id: str) -> Optional[AuditEntry]:
+        """Look up a step in memory, then in the on-disk trail (latest run wins)."""
+        # Scan a snapshot: verify runs on a worker thread while the event
+        # loop may still be appending to the deque
+        entry = next((e for e in tuple(self.audit_log) if e.step_id == step_id), None)
+        if entry is not None or not self.audit_path:
+            return entry
+        try:
+            with open(self.audit_path, encoding="utf-8") as f:
+                for line in f:
+                    record = orjson.loads(line)
+                    if record.get("step_id") == step_id:
+                        entry = AuditEntry(**{
+                            k: v for k, v in record.items() if k in _AUDIT_FIELDS
+                        })
+        except (OSError, orjson.JSONDecodeError):
+            return None
+        return entry
+
+    def close_audit(self):
+        """Stop appending to the audit file. audit_path stays readable."""
+        if self._audit_fp is not None:
+            self._audit_fp.close()
+            self._audit_fp = None
+
+    def close(self):
+        """Flush the audit trail and release HTTP connections."""
+        self.close_audit()
+        self.client.close()
 
     # ──────────────────────────────────────────────────
     # CORE: Verifiable inference wrapper
     # ──────────────────────────────────────────────────
 
-    def _call(self, messages: list, milestone: str, action: str) -> str:
+    async def _call(
+        self,
+        messages: list,
+        milestone: str,
+        action: str,
+        stream_cb: Optional[Callable[[str], None]] = None,
+        max_tokens: Optional[int] = None,
+    ) -> str:
         """
         Every LLM call goes through here. Every call is:
         1. Hashed (input + output)
         2. Logged in the audit trail
         3. Reproducible via EigenAI determinism
-        """
-        self.step_counter += 1
-        step_id = f"{milestone}_{self.step_counter:03d}"
 
-        prompt_str = json.dumps(messages, sort_keys=True, ensure_ascii=False)
-        prompt_hash = hashlib.sha256(prompt_str.encode()).hexdigest()
+        max_tokens defaults to the MAX_TOKENS budget for the action.
 
-        # Retry once on failure — EigenAI is mainnet alpha
-        last_error = None
-        for attempt in range(2):
-            try:
-                response = self.client.chat_completion(
+        With stream_cb, the completion is streamed and each raw chunk is
+        forwarded as it arrives. Hashing still runs over the full stripped
+        output, so the audit entry is identical to the non-streamed call.
+        """
+        if max_tokens is None:
+            max_tokens = MAX_TOKENS.get(action, DEFAULT_MAX_TOKENS)
+        step_id, prompt_str, prompt_hash = self._begin_step(messages, milestone)
+
+        # Transient failures are retried with backoff inside the client
+        try:
+            if stream_cb is None:
+                response = await self.client.achat_completion(
                     model=self.model,
                     messages=messages,
                     seed=self.seed,
                     temperature=0.0,
-                    max_tokens=4096,
+                    max_tokens=max_tokens,
+                    limiter=self.rate_limiter,
                 )
-                break
-            except Exception as e:
-                last_error = e
-                if attempt == 0:
-                    time.sleep(2)
-        else:
-            raise RuntimeError(
-                f"EigenAI call failed after 2 attempts ({action}): {last_error}"
+            else:
+                parts = []
+                async for chunk in self.client.achat_completion_stream(
+                    model=self.model,
+                    messages=messages,
+                    seed=self.seed,
+                    temperature=0.0,
+                    max_tokens=max_tokens,
+                    limiter=self.rate_limiter,
+                ):
+                    parts.append(chunk)
+                    stream_cb(chunk)
+                response = {"choices": [{"message": {"content": "".join(parts)}}]}
+        except (requests.RequestException, httpx.HTTPError) as e:
+            raise RuntimeError(f"EigenAI call failed ({action}): {e}") from e
+
+        async with self._audit_lock:
+            return self._record_step(
+                step_id, milestone, action, prompt_str, prompt_hash, response,
+                max_tokens=max_tokens,
             )
 
+    def _begin_step(self, messages: list, milestone: str) -> tuple[str, str, str]:
+        """Allocate a step id and hash the prompt. Returns (step_id, prompt_str, prompt_hash)."""
+        prompt_str, prompt_hash = self._hash_prompt(messages)
+        return self._next_step_id(milestone), prompt_str, prompt_hash
+
+    def _next_step_id(self, milestone: str) -> str:
+        self.step_counter += 1
+        return f"{milestone}_{self.step_counter:03d}"
+
+    def _hash_prompt(self, messages: list) -> tuple[str, str]:
+        # orjson's sorted-key output is byte-stable and already UTF-8 bytes,
+        # so it is hashed as-is; the decoded string is kept as full_prompt.
+        prompt_bytes = orjson.dumps(
+            messages, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+        )
+        return prompt_bytes.decode(), _sha256_hex(prompt_bytes)
+
+    def _record_step(
+        self,
+        step_id: str,
+        milestone: str,
+        action: str,
+        prompt_str: str,
+        prompt_hash: str,
+        response: dict,
+        choice_index: int = 0,
+        n: int = 1,
+        temperature: float = 0.0,
+        max_tokens: int = DEFAULT_MAX_TOKENS,
+        section: str = "",
+    ) -> str:
+        """Extract, strip and hash the output, then append the audit entry."""
         # Extract output text from response
         output = ""
         try:
-            output = response["choices"][0]["message"]["content"] or ""
+            output = response["choices"][choice_index]["message"]["content"] or ""
         except (KeyError, IndexError):
             output = str(response)
 
         # Strip model's chain-of-thought / channel tokens from ALL outputs
         # Must use _strip_tokens() so verify_step applies identical stripping.
         output = self._strip_tokens(output)
+        if section:
+            output = self._section_output(output, section)
 
-        output_hash = hashlib.sha256(output.encode()).hexdigest()
+        output_hash = _sha256_hex(output)
 
         entry = AuditEntry(
             step_id=step_id,
@@ -202,20 +692,102 @@ class SovereignScientist:
             action=action,
             prompt_hash=prompt_hash,
             output_hash=output_hash,
-            output_preview=output[:300],
             model=self.model,
             seed=self.seed,
             full_prompt=prompt_str,
             full_output=output,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            n=n,
+            choice_index=choice_index,
+            section=section,
         )
-        self.audit_log.append(entry)
+        self._append_audit(entry)
         return output
 
+    def _section_output(self, output: str, section: str) -> str:
+        """Canonical JSON of the `section` keys of a fast-path output."""
+        data = self._parse_fast_output(output) or {}
+        subset = {key: data.get(key) for key in section.split(",")}
+        return orjson.dumps(subset, option=orjson.OPT_SORT_KEYS).decode()
+
+    def _parse_fast_output(self, output: str) -> Optional[dict]:
+        """The JSON object of a fast-path output, or None if it is unusable."""
+        # Start at the object: _parse_json would otherwise pick out the
+        # first nested array ("hypotheses") when there is leading noise
+        start = output.find("{")
+        try:
+            data = self._parse_json(output[start:] if start != -1 else output)
+        except json.JSONDecodeError:
+            return None
+        if not isinstance(data, dict):
+            return None
+        # Selection indexes into the hypotheses, so they must be objects
+        hypotheses = data.get("hypotheses")
+        if not (isinstance(hypotheses, list) and hypotheses
+                and all(isinstance(h, dict) for h in hypotheses)):
+            return None
+        return data
+
+    async def _call_drafts(
+        self, messages: list, milestone: str, action: str, n: int
+    ) -> list[str]:
+        """
+        Sample n candidate outputs in a single generation (`n` choices) and
+        audit each choice as its own step. Falls back to one greedy _call()
+        when the API ignores `n`.
+        """
+        if n <= 1 or self.client.supports_n is False:
+            return [await self._call(messages, milestone, action)]
+
+        max_tokens = MAX_TOKENS.get(action, DEFAULT_MAX_TOKENS)
+
+        prompt_str, prompt_hash = self._hash_prompt(messages)
+        try:
+            response = await self.client.achat_completion(
+                model=self.model,
+                messages=messages,
+                seed=self.seed,
+                temperature=DRAFT_TEMPERATURE,
+                max_tokens=max_tokens,
+                n=n,
+                limiter=self.rate_limiter,
+            )
+        except httpx.HTTPStatusError as e:
+            if self.client.supports_n is None and e.response.status_code in (400, 422):
+                # The API rejects `n` outright: remember that process-wide
+                # and take the same greedy path as an API that ignores it
+                type(self.client).supports_n = False
+                return [await self._call(messages, milestone, action)]
+            raise RuntimeError(f"EigenAI call failed ({action}): {e}") from e
+        except (requests.RequestException, httpx.HTTPError) as e:
+            raise RuntimeError(f"EigenAI call failed ({action}): {e}") from e
+
+        choices = response.get("choices") or [{}]
+        type(self.client).supports_n = len(choices) > 1
+        if len(choices) == 1:
+            # `n` was ignored: drop the lone sampled draft and make the same
+            # greedy (cacheable) call every later run makes, so M1 doesn't
+            # depend on whether this run happened to be the probe
+            return [await self._call(messages, milestone, action)]
+
+        outputs = []
+        async with self._audit_lock:
+            for i in range(len(choices)):
+                outputs.append(self._record_step(
+                    self._next_step_id(milestone), milestone, action,
+                    prompt_str, prompt_hash, response,
+                    choice_index=i, n=n, temperature=DRAFT_TEMPERATURE,
+                    max_tokens=max_tokens,
+                ))
+        return outputs
+
     def _parse_json(self, raw: str) -> dict | list:
         """Robustly parse JSON from LLM output, even with chain-of-thought noise."""
         clean = raw.strip()
         # Strip harmony/channel tokens like <|channel|>analysis<|message|>
-        clean = re.sub(r"<\|[^|]*\|>", "", clean).strip()
+        if "<|" in clean:
+            clean = _TOKEN_RE.sub("", clean).strip()
         # Strip markdown fences
         if clean.startswith("```"):
             clean = clean.split("\n", 1)[1] if "\n" in clean else clean[3:]
@@ -224,50 +796,22 @@ class SovereignScientist:
 
         # Try direct parse first
         try:
-            return json.loads(clean)
-        except json.JSONDecodeError:
+            return orjson.loads(clean)
+        except orjson.JSONDecodeError:
             pass
 
-        # Find the first JSON array [...] or object {...} in the text
-        for start_char, end_char in [('[', ']'), ('{', '}')]:
-            start = clean.find(start_char)
-            if start == -1:
-                continue
-            depth = 0
-            in_string = False
-            escape = False
-            for i in range(start, len(clean)):
-                c = clean[i]
-                if escape:
-                    escape = False
-                    continue
-                if c == '\\':
-                    escape = True
-                    continue
-                if c == '"':
-                    in_string = not in_string
-                    continue
-                if in_string:
-                    continue
-                if c == start_char:
-                    depth += 1
-                elif c == end_char:
-                    depth -= 1
-                    if depth == 0:
-                        candidate = clean[start:i+1]
-                        try:
-                            return json.loads(candidate)
-                        except json.JSONDecodeError:
-                            break
-
-        # Last resort: strip everything before first { or [
-        for ch in ['{', '[']:
-            idx = clean.find(ch)
-            if idx != -1:
-                try:
-                    return json.loads(clean[idx:])
-                except json.JSONDecodeError:
-                    pass
+        # Decode the first complete JSON array [...] or object {...} in the
+        # text, trying candidates in text order. raw_decode runs the C
+        # scanner from an offset and ignores whatever trails the value; on
+        # failure move to the next "[" or "{" after this one.
+        decoder = json.JSONDecoder()
+        start = _JSON_START_RE.search(clean)
+        while start is not None:
+            try:
+                obj, _end = decoder.raw_decode(clean, start.start())
+                return obj
+            except json.JSONDecodeError:
+                start = _JSON_START_RE.search(clean, start.start() + 1)
 
         raise json.JSONDecodeError("No valid JSON found", clean, 0)
 
@@ -277,14 +821,47 @@ class SovereignScientist:
 
     def _strip_tokens(self, raw: str) -> str:
         """Apply the same token stripping used in _call(). Must be identical."""
-        output = re.sub(
-            r"<\|channel\|>\s*analysis\s*<\|message\|>.*?<\|end\|>",
-            "", raw, flags=re.DOTALL
-        ).strip()
-        output = re.sub(r"<\|[^|]*\|>", "", output).strip()
+        # Both patterns start with "<|" — without it neither can match
+        if "<|" not in raw:
+            return raw.strip()
+        output = _CHANNEL_RE.sub("", raw).strip()
+        output = _TOKEN_RE.sub("", output).strip()
         return output
 
-    def verify_step(self, step_id: str) -> dict:
+    def _verify_key(self, entry: AuditEntry) -> str:
+        """Everything that determines the output: the request and its result."""
+        return "|".join(str(v) for v in (
+            entry.prompt_hash, entry.output_hash, entry.model, entry.seed,
+            entry.max_tokens, entry.temperature, entry.n, entry.choice_index,
+            entry.section,
+        ))
+
+    def _load_verify_cache(self) -> dict[str, dict]:
+        proofs = {}
+        if not self._verify_path:
+            return proofs
+        try:
+            with open(self._verify_path, encoding="utf-8") as f:
+                for line in f:
+                    record = orjson.loads(line)
+                    proofs[record["key"]] = record["result"]
+        except (OSError, orjson.JSONDecodeError, KeyError):
+            pass
+        return proofs
+
+    def _remember_verification(self, key: str, result: dict):
+        known = key in self._verify_cache
+        self._verify_cache[key] = result
+        # A forced re-verification of a known proof adds nothing to the file
+        if known or not self._verify_path:
+            return
+        os.makedirs(os.path.dirname(self._verify_path), exist_ok=True)
+        with open(self._verify_path, "a", encoding="utf-8") as f:
+            f.write(orjson.dumps({"key": key, "result": result}).decode() + "\n")
+
+    def verify_step(
+        self, step_id: str, force_refresh: bool = True, force: bool = False
+    ) -> dict:
         """
         Re-execute a step on EigenAI and compare output hashes.
 
@@ -292,39 +869,106 @@ class SovereignScientist:
         for same model + prompt + seed). This re-executes the exact same call
         and applies the same token stripping as the original _call(), then
         compares SHA256 hashes. A match proves the agent ran as committed.
+
+        The response cache is bypassed by default — a cached replay would
+        trivially match and prove nothing about the live API.
+
+        A match is final, so it is remembered: verifying the same request and
+        output again returns the stored proof with "cache": "hit" instead of
+        re-executing. force=True always re-executes.
         """
-        entry = next((e for e in self.audit_log if e.step_id == step_id), None)
+        entry = self._find_entry(step_id)
         if not entry:
             return {"error": f"Step {step_id} not found"}
 
-        original_messages = json.loads(entry.full_prompt)
+        cached = None if force else self._stored_proof(entry)
+        if cached is not None:
+            return cached
+        return self._check_entry(entry, self._reexecute(entry, force_refresh))
 
-        # Re-execute on EigenAI with identical parameters
-        response = self.client.chat_completion(
+    def verify_steps_batch(
+        self,
+        step_ids: list[str],
+        force_refresh: bool = True,
+        force: bool = False,
+        max_workers: int = 8,
+    ) -> list[dict]:
+        """
+        verify_step() for many steps. Entries recorded from the same request
+        (the drafts of one n>1 call, the sections of a fast-path run) are
+        checked against ONE re-execution; distinct requests re-execute up to
+        max_workers at once over the client's shared connection pool.
+        Results are in input order.
+        """
+        results: list[Optional[dict]] = [None] * len(step_ids)
+        groups: dict[tuple, list[tuple[int, AuditEntry]]] = {}
+        for i, step_id in enumerate(step_ids):
+            entry = self._find_entry(step_id)
+            if entry is None:
+                results[i] = {"error": f"Step {step_id} not found"}
+                continue
+            cached = None if force else self._stored_proof(entry)
+            if cached is not None:
+                results[i] = cached
+                continue
+            request = (
+                entry.prompt_hash, entry.model, entry.seed,
+                entry.max_tokens, entry.temperature, entry.n,
+            )
+            groups.setdefault(request, []).append((i, entry))
+
+        def verify_group(members: list[tuple[int, AuditEntry]]):
+            response = self._reexecute(members[0][1], force_refresh)
+            for i, entry in members:
+                results[i] = self._check_entry(entry, response)
+
+        if groups:
+            workers = min(max_workers, len(groups))
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                # list() surfaces any exception from the workers
+                list(pool.map(verify_group, groups.values()))
+        return results
+
+    def _stored_proof(self, entry: AuditEntry) -> Optional[dict]:
+        cached = self._verify_cache.get(self._verify_key(entry))
+        if cached is None:
+            return None
+        entry.verified = True
+        entry.verification_match = True
+        return {**cached, "step_id": entry.step_id, "cache": "hit"}
+
+    def _reexecute(self, entry: AuditEntry, force_refresh: bool) -> dict:
+        """Re-run the request behind `entry` on EigenAI with identical parameters."""
+        return self.client.chat_completion(
             model=entry.model,
-            messages=original_messages,
+            messages=orjson.loads(entry.full_prompt),
             seed=entry.seed,
-            temperature=0.0,
-            max_tokens=4096,
+            temperature=entry.temperature,
+            max_tokens=entry.max_tokens,
+            force_refresh=force_refresh,
+            n=entry.n,
         )
 
+    def _check_entry(self, entry: AuditEntry, response: dict) -> dict:
+        """Hash `entry`'s part of a re-executed response and compare."""
         raw_output = ""
         try:
-            raw_output = response["choices"][0]["message"]["content"] or ""
+            raw_output = response["choices"][entry.choice_index]["message"]["content"] or ""
         except (KeyError, IndexError):
             raw_output = str(response)
 
         # Apply IDENTICAL stripping as _call() — this was the original bug:
         # verify_step hashed raw output while _call() hashed stripped output.
         new_output = self._strip_tokens(raw_output)
-        new_hash = hashlib.sha256(new_output.encode()).hexdigest()
+        if entry.section:
+            new_output = self._section_output(new_output, entry.section)
+        new_hash = _sha256_hex(new_output)
         match = new_hash == entry.output_hash
 
         entry.verified = True
         entry.verification_match = match
 
-        return {
-            "step_id": step_id,
+        result = {
             "original_hash": entry.output_hash,
             "verification_hash": new_hash,
             "match": match,
@@ -333,12 +977,20 @@ class SovereignScientist:
             "prompt_hash": entry.prompt_hash,
             "status": "VERIFIED ✓" if match else "MISMATCH ✗",
         }
+        if match:
+            self._remember_verification(self._verify_key(entry), result)
+        return {"step_id": entry.step_id, **result, "cache": "miss"}
 
     # ──────────────────────────────────────────────────
     # M1: HYPOTHESIS GENERATION
     # ──────────────────────────────────────────────────
 
-    def generate_hypotheses(self, topic: str, n: int = 3) -> list:
+    async def generate_hypotheses(self, topic: str, n: int = 3, drafts: int = 3) -> list:
+        """
+        Ask for n hypotheses, sampling `drafts` independent answers in one
+        generation. The drafts are pooled (deduplicated by title) so the
+        novelty assessment picks from a wider candidate set.
+        """
         messages = [
             {
                 "role": "system",
@@ -360,14 +1012,29 @@ class SovereignScientist:
             {"role": "user", "content": f"Topic: {topic}\nGenerate {n} hypotheses."},
         ]
 
-        raw = self._call(messages, "M1_IDEATION", "generate_hypotheses")
-        try:
-            return self._parse_json(raw)
-        except (json.JSONDecodeError, ValueError):
-            return [{"title": "Generation completed", "raw_output": raw[:500]}]
+        raws = await self._call_drafts(messages, "M1_IDEATION", "generate_hypotheses", drafts)
 
-    def assess_novelty(self, hypothesis: dict) -> dict:
-        messages = [
+        pool = []
+        seen_titles = set()
+        for raw in raws:
+            try:
+                parsed = self._parse_json(raw)
+            except (json.JSONDecodeError, ValueError):
+                continue
+            for h in parsed if isinstance(parsed, list) else [parsed]:
+                title = h.get("title") if isinstance(h, dict) else None
+                if title is not None:
+                    if title in seen_titles:
+                        continue
+                    seen_titles.add(title)
+                pool.append(h)
+
+        if not pool:
+            return [{"title": "Generation completed", "raw_output": raws[0][:500]}]
+        return pool
+
+    def _novelty_messages(self, hypothesis: dict) -> list:
+        return [
             {
                 "role": "system",
                 "content": (
@@ -383,7 +1050,7 @@ class SovereignScientist:
             {"role": "user", "content": json.dumps(hypothesis)},
         ]
 
-        raw = self._call(messages, "M1_IDEATION", "assess_novelty")
+    def _parse_novelty(self, raw: str) -> dict:
         try:
             result = self._parse_json(raw)
             # Ensure we always return a dict
@@ -395,11 +1062,76 @@ class SovereignScientist:
         except (json.JSONDecodeError, ValueError):
             return {"score": 5, "reasoning": raw[:300]}
 
+    async def assess_novelty(self, hypothesis: dict) -> dict:
+        raw = await self._call(
+            self._novelty_messages(hypothesis), "M1_IDEATION", "assess_novelty"
+        )
+        return self._parse_novelty(raw)
+
+    async def assess_novelty_batch(self, hypotheses: list) -> list:
+        """Score every hypothesis concurrently — the calls are independent."""
+        async def score(h) -> dict:
+            if isinstance(h, dict) and "title" in h:
+                return await self.assess_novelty(h)
+            return {"score": 0}
+
+        return list(await asyncio.gather(*[score(h) for h in hypotheses]))
+
+    async def assess_novelty_all(self, hypotheses: list) -> list:
+        """
+        Score every hypothesis in one request instead of one request each.
+        Falls back to concurrent per-hypothesis calls if the model does not
+        return exactly one score object per input, in order.
+        """
+        scorable = [h for h in hypotheses if isinstance(h, dict) and "title" in h]
+        if not scorable:
+            return [{"score": 0} for _ in hypotheses]
+
+        messages = [
+            {
+                "role": "system",
+                "content": (
+                    "You are a research novelty assessor. "
+                    "Score each hypothesis in the input array for novelty on a 1-10 scale.\n\n"
+                    "Output a JSON array of "
+                    '{"score": int, "reasoning": str, "related_work": [str], "differentiators": [str]} '
+                    "objects, one per input, in order.\n\n"
+                    "IMPORTANT: Output ONLY the JSON array. "
+                    "Do NOT include any reasoning or chain-of-thought. "
+                    "Start your response with [ and end with ]."
+                ),
+            },
+            {"role": "user", "content": json.dumps(scorable)},
+        ]
+
+        # One assess_novelty budget per hypothesis scored
+        budget = min(MAX_TOKENS["assess_novelty"] * len(scorable), DEFAULT_MAX_TOKENS)
+        raw = await self._call(
+            messages, "M1_IDEATION", "assess_novelty_all", max_tokens=budget
+        )
+        try:
+            result = self._parse_json(raw)
+        except (json.JSONDecodeError, ValueError):
+            result = None
+
+        if not (
+            isinstance(result, list)
+            and len(result) == len(scorable)
+            and all(isinstance(r, dict) for r in result)
+        ):
+            return await self.assess_novelty_batch(hypotheses)
+
+        scores = iter(result)
+        return [
+            next(scores) if isinstance(h, dict) and "title" in h else {"score": 0}
+            for h in hypotheses
+        ]
+
     # ──────────────────────────────────────────────────
     # M2: EXPERIMENT DESIGN
     # ──────────────────────────────────────────────────
 
-    def design_experiment(self, hypothesis: dict) -> dict:
+    async def design_experiment(self, hypothesis: dict) -> dict:
         messages = [
             {
                 "role": "system",
@@ -423,7 +1155,7 @@ class SovereignScientist:
             {"role": "user", "content": json.dumps(hypothesis)},
         ]
 
-        raw = self._call(messages, "M2_DESIGN", "design_experiment")
+        raw = await self._call(messages, "M2_DESIGN", "design_experiment")
         try:
             result = self._parse_json(raw)
             if isinstance(result, list):
@@ -432,7 +1164,11 @@ class SovereignScientist:
         except (json.JSONDecodeError, ValueError):
             return {"method": raw[:500]}
 
-    def generate_code(self, experiment: dict) -> str:
+    async def generate_code(
+        self,
+        experiment: dict,
+        stream_cb: Optional[Callable[[str], None]] = None,
+    ) -> str:
         messages = [
             {
                 "role": "system",
@@ -448,13 +1184,13 @@ class SovereignScientist:
             {"role": "user", "content": json.dumps(experiment)},
         ]
 
-        return self._call(messages, "M2_DESIGN", "generate_code")
+        return await self._call(messages, "M2_DESIGN", "generate_code", stream_cb=stream_cb)
 
     # ──────────────────────────────────────────────────
     # M3: RESULT ANALYSIS
     # ──────────────────────────────────────────────────
 
-    def analyze_results(self, hypothesis: dict, results: dict) -> dict:
+    async def analyze_results(self, hypothesis: dict, results: dict) -> dict:
         messages = [
             {
                 "role": "system",
@@ -483,7 +1219,7 @@ class SovereignScientist:
             },
         ]
 
-        raw = self._call(messages, "M3_ANALYSIS", "analyze_results")
+        raw = await self._call(messages, "M3_ANALYSIS", "analyze_results")
         try:
             result = self._parse_json(raw)
             if isinstance(result, list):
@@ -496,7 +1232,13 @@ class SovereignScientist:
     # M4: PAPER WRITING
     # ──────────────────────────────────────────────────
 
-    def write_abstract(self, hypothesis: dict, results: dict, analysis: dict) -> str:
+    async def write_abstract(
+        self,
+        hypothesis: dict,
+        results: dict,
+        analysis: dict,
+        stream_cb: Optional[Callable[[str], None]] = None,
+    ) -> str:
         messages = [
             {
                 "role": "system",
@@ -519,35 +1261,313 @@ class SovereignScientist:
             },
         ]
 
-        return self._call(messages, "M4_WRITING", "write_abstract")
+        return await self._call(messages, "M4_WRITING", "write_abstract", stream_cb=stream_cb)
 
     # ──────────────────────────────────────────────────
     # FULL PIPELINE
     # ──────────────────────────────────────────────────
 
+    def _run_async(self, coro):
+        """Drive a coroutine from sync code, closing the loop-bound HTTP pool after."""
+        async def runner():
+            try:
+                return await coro
+            finally:
+                await self.client.aclose()
+
+        return asyncio.run(runner())
+
     def run_pipeline(
         self,
         topic: str,
         on_milestone: Optional[Callable[[str], None]] = None,
+        on_stream: Optional[Callable[[str, str], None]] = None,
     ) -> dict:
-        """Execute the complete verifiable research program."""
+        """Blocking arun_pipeline() for scripts and other sync callers."""
+        return self._run_async(self.arun_pipeline(topic, on_milestone, on_stream))
+
+    async def arun_pipeline(
+        self,
+        topic: str,
+        on_milestone: Optional[Callable[[str], None]] = None,
+        on_stream: Optional[Callable[[str, str], None]] = None,
+    ) -> dict:
+        """
+        Execute the complete verifiable research program.
+
+        on_stream(action, chunk) receives live output from the long-form
+        steps (generate_code, write_abstract) while they generate.
+        """
 
         def _notify(ms: str):
             if on_milestone:
                 on_milestone(ms)
 
+        program_hash = _sha256_hex(topic)
+        self._open_audit(program_hash)
+
         # ── M1: Ideation ─────────────────────────────
         _notify("M1_IDEATION")
-        hypotheses = self.generate_hypotheses(topic)
+        return await self._arun_program(topic, program_hash, _notify, on_stream)
 
-        novelty_scores = []
-        for h in hypotheses:
-            if isinstance(h, dict) and "title" in h:
-                score = self.assess_novelty(h)
-                novelty_scores.append(score)
-            else:
-                novelty_scores.append({"score": 0})
+    async def _arun_program(
+        self,
+        topic: str,
+        program_hash: str,
+        notify: Callable[[str], None],
+        on_stream: Optional[Callable[[str, str], None]] = None,
+    ) -> dict:
+        """The chain of arun_pipeline() from M1 generation on, into the open audit trail."""
+
+        def _stream_to(action: str) -> Optional[Callable[[str], None]]:
+            if on_stream is None:
+                return None
+            return lambda chunk: on_stream(action, chunk)
+
+        hypotheses = await self.generate_hypotheses(topic)
+
+        novelty_scores = await self.assess_novelty_all(hypotheses)
+
+        selected = self._select_best(hypotheses, novelty_scores)
+
+        # ── M2: Design ───────────────────────────────
+        notify("M2_DESIGN")
+        experiment = await self.design_experiment(selected)
+        code = await self.generate_code(experiment, stream_cb=_stream_to("generate_code"))
+
+        # ── M3: Analysis ─────────────────────────────
+        notify("M3_ANALYSIS")
+        sim_results = SIMULATED_RESULTS
+        analysis = await self.analyze_results(selected, sim_results)
 
+        # ── M4: Writing ──────────────────────────────
+        notify("M4_WRITING")
+        abstract = await self.write_abstract(
+            selected, sim_results, analysis, stream_cb=_stream_to("write_abstract")
+        )
+
+        # ── Provenance ───────────────────────────────
+        notify("DONE")
+
+        return self._build_result(
+            topic, program_hash, hypotheses, novelty_scores, selected,
+            experiment, code, sim_results, analysis, abstract,
+        )
+
+    def run_pipeline_fast(
+        self,
+        topic: str,
+        on_milestone: Optional[Callable[[str], None]] = None,
+    ) -> dict:
+        """Blocking arun_pipeline_fast()."""
+        return self._run_async(self.arun_pipeline_fast(topic, on_milestone))
+
+    async def arun_pipeline_fast(
+        self,
+        topic: str,
+        on_milestone: Optional[Callable[[str], None]] = None,
+    ) -> dict:
+        """
+        The whole research program in ONE generation instead of a chain of
+        dependent calls — for when only the end product is needed.
+
+        The single output is split into one audit entry per milestone (see
+        FAST_PATH_SECTIONS). Each entry hashes the canonical JSON of its
+        section, so verify_step re-executes the one prompt and checks that
+        milestone's slice of the output. If the output is not a JSON object
+        with a list of hypothesis objects, it is audited as is and the
+        arun_pipeline() step chain runs into the same trail.
+        """
+
+        def _notify(ms: str):
+            if on_milestone:
+                on_milestone(ms)
+
+        program_hash = _sha256_hex(topic)
+        self._open_audit(program_hash)
+        _notify("M1_IDEATION")
+
+        messages = [
+            {
+                "role": "system",
+                "content": (
+                    "You are an autonomous AI research scientist. "
+                    "Run a complete research program on the given topic in one pass.\n\n"
+                    "Output a JSON object with:\n"
+                    '- "hypotheses": [3 objects with "title", "description", "novelty", '
+                    '"testable_prediction", "experiment_sketch", "risk"]\n'
+                    '- "novelty": [one {"score": int 1-10, "reasoning": str, '
+                    '"related_work": [str], "differentiators": [str]} per hypothesis, in order]\n'
+                    '- "selected_index": index of the most novel hypothesis\n'
+                    '- "experiment": rigorous experiment for the selected hypothesis with '
+                    '"method", "baselines", "datasets", "metrics", "hyperparameters", '
+                    '"ablations", "compute_estimate_gpu_hours", "expected_results"\n'
+                    '- "code": complete runnable PyTorch script for the experiment, '
+                    "under 150 lines, printing results as JSON\n"
+                    '- "analysis": honest analysis of the given results against the selected '
+                    'hypothesis: {"verdict": str, "confidence": float 0-1, '
+                    '"key_findings": [str], "limitations": [str], "follow_ups": [str]}\n'
+                    '- "abstract": academic abstract under 250 words, '
+                    "context → problem → method → results → impact\n\n"
+                    "IMPORTANT: Output ONLY the JSON object. "
+                    "Do NOT include any reasoning or chain-of-thought. "
+                    "Start your response with { and end with }."
+                ),
+            },
+            {
+                "role": "user",
+                "content": json.dumps({"topic": topic, "results": SIMULATED_RESULTS}),
+            },
+        ]
+
+        max_tokens = MAX_TOKENS["run_pipeline_fast"]
+        prompt_str, prompt_hash = self._hash_prompt(messages)
+        try:
+            response = await self.client.achat_completion(
+                model=self.model,
+                messages=messages,
+                seed=self.seed,
+                temperature=0.0,
+                max_tokens=max_tokens,
+                limiter=self.rate_limiter,
+            )
+        except (requests.RequestException, httpx.HTTPError) as e:
+            raise RuntimeError(f"EigenAI call failed (run_pipeline_fast): {e}") from e
+
+        try:
+            raw = response["choices"][0]["message"]["content"] or ""
+        except (KeyError, IndexError):
+            raw = ""
+        data = self._parse_fast_output(self._strip_tokens(raw))
+        if data is None:
+            # Keep the unusable output in the trail, then run the step chain
+            # into the same trail; M1 has already been announced
+            async with self._audit_lock:
+                self._record_step(
+                    self._next_step_id("M1_IDEATION"), "M1_IDEATION", "run_pipeline_fast",
+                    prompt_str, prompt_hash, response, max_tokens=max_tokens,
+                )
+            return await self._arun_program(topic, program_hash, _notify)
+
+        async with self._audit_lock:
+            for milestone, section in FAST_PATH_SECTIONS.items():
+                self._record_step(
+                    self._next_step_id(milestone), milestone, "run_pipeline_fast",
+                    prompt_str, prompt_hash, response,
+                    max_tokens=max_tokens, section=section,
+                )
+
+        hypotheses = data["hypotheses"]
+        novelty_scores = data.get("novelty")
+        if not isinstance(novelty_scores, list):
+            novelty_scores = []
+        selected_index = data.get("selected_index")
+        if isinstance(selected_index, int) and 0 <= selected_index < len(hypotheses):
+            selected = hypotheses[selected_index]
+        else:
+            selected = self._select_best(hypotheses, novelty_scores[:len(hypotheses)])
+        code = data.get("code")
+
+        for milestone in ("M2_DESIGN", "M3_ANALYSIS", "M4_WRITING", "DONE"):
+            _notify(milestone)
+
+        return self._build_result(
+            topic, program_hash, hypotheses, novelty_scores, selected,
+            data.get("experiment") or {}, code if isinstance(code, str) else "",
+            SIMULATED_RESULTS, data.get("analysis") or {}, data.get("abstract") or "",
+        )
+
+    def spawn(
+        self, audit_namespace: str, run_id: Optional[str] = None
+    ) -> "SovereignScientist":
+        """
+        A fresh agent for another run on the same client (auth, connection
+        pool, cache), auditing under this agent's audit_dir/audit_namespace.
+        """
+        return SovereignScientist(
+            self.client.wallet_address,
+            self.client.private_key,
+            model=self.model,
+            seed=self.seed,
+            use_cache=self.use_cache,
+            cache_dir=self.cache_dir,
+            audit_dir=self.audit_dir,
+            audit_namespace=audit_namespace,
+            client=self.client,
+            run_id=run_id,
+            verify_cache=self._verify_cache,
+        )
+
+    def run_pipeline_many(
+        self,
+        topics: list[str],
+        max_concurrency: int = 5,
+        rpm: int = 60,
+        on_progress: Optional[Callable[[int, int], None]] = None,
+    ) -> list[dict]:
+        """Blocking arun_pipeline_many()."""
+        return self._run_async(
+            self.arun_pipeline_many(topics, max_concurrency, rpm, on_progress)
+        )
+
+    async def arun_pipeline_many(
+        self,
+        topics: list[str],
+        max_concurrency: int = 5,
+        rpm: int = 60,
+        on_progress: Optional[Callable[[int, int], None]] = None,
+        agents: Optional[list["SovereignScientist"]] = None,
+        on_milestone: Optional[Callable[[int, str], None]] = None,
+        on_result: Optional[Callable[[int, dict], None]] = None,
+        run_slots: Optional[asyncio.Semaphore] = None,
+    ) -> list[dict]:
+        """
+        Run the pipeline for several topics at once.
+
+        At most max_concurrency pipelines run at a time and API requests are
+        capped at rpm per minute across all of them. Each topic runs on its
+        own agent (spawn(f"topic_{i:03d}") unless `agents` are given), so
+        audit trails and step ids stay separate. on_progress(done, total)
+        fires as topics finish; on_milestone(i, milestone) and
+        on_result(i, result) report per topic. `run_slots`, if given, is a
+        wider concurrency cap (e.g. the server's) each topic also holds.
+
+        Returns one result per topic, in order. A topic that fails gets
+        {"program": {"topic": ...}, "error": ...} instead.
+        """
+        if agents is None:
+            agents = [self.spawn(f"topic_{i:03d}") for i in range(len(topics))]
+        slots = asyncio.Semaphore(max_concurrency)
+        # This batch's budget; set on its own agents, never the shared client
+        limiter = AsyncLimiter(rpm, 60)
+        for agent in agents:
+            agent.rate_limiter = limiter
+        done = 0
+
+        async def run_one(i: int, topic: str) -> dict:
+            nonlocal done
+            agent = agents[i]
+            notify = (lambda ms: on_milestone(i, ms)) if on_milestone else None
+            async with slots, run_slots or nullcontext():
+                try:
+                    result = await agent.arun_pipeline(topic, on_milestone=notify)
+                except Exception as e:
+                    result = {"program": {"topic": topic}, "error": str(e)}
+                finally:
+                    agent.close_audit()
+            done += 1
+            if on_result:
+                on_result(i, result)
+            if on_progress:
+                on_progress(done, len(topics))
+            return result
+
+        return await asyncio.gather(
+            *(run_one(i, topic) for i, topic in enumerate(topics))
+        )
+
+    def _select_best(self, hypotheses: list, novelty_scores: list) -> dict:
+        """The hypothesis with the highest novelty score (first one on ties)."""
         best_idx = 0
         best_score = -1
         for i, ns in enumerate(novelty_scores):
@@ -561,32 +1581,21 @@ class SovereignScientist:
                 best_score = s
                 best_idx = i
 
-        selected = hypotheses[best_idx] if hypotheses else {}
-
-        # ── M2: Design ───────────────────────────────
-        _notify("M2_DESIGN")
-        experiment = self.design_experiment(selected)
-        code = self.generate_code(experiment)
-
-        # ── M3: Analysis ─────────────────────────────
-        _notify("M3_ANALYSIS")
-        sim_results = {
-            "baseline": {"mean_reward": 145.3, "std": 12.1, "success_rate": 0.72},
-            "proposed": {"mean_reward": 178.9, "std": 9.8, "success_rate": 0.84},
-            "improvement": "+23.1% reward, +16.7% success rate",
-            "statistical_test": "p < 0.01 (Welch's t-test)",
-            "note": "Simulated for demo. Real execution runs in EigenCompute TEE.",
-        }
-        analysis = self.analyze_results(selected, sim_results)
-
-        # ── M4: Writing ──────────────────────────────
-        _notify("M4_WRITING")
-        abstract = self.write_abstract(selected, sim_results, analysis)
-
-        # ── Provenance ───────────────────────────────
-        _notify("DONE")
-        program_hash = hashlib.sha256(topic.encode()).hexdigest()
+        return hypotheses[best_idx] if hypotheses else {}
 
+    def _build_result(
+        self,
+        topic: str,
+        program_hash: str,
+        hypotheses: list,
+        novelty_scores: list,
+        selected: dict,
+        experiment: dict,
+        code: str,
+        sim_results: dict,
+        analysis: dict,
+        abstract: str,
+    ) -> dict:
         return {
             "program": {
                 "topic": topic,
@@ -7,23 +7,144 @@ Env vars needed: WALLET_ADDRESS, WALLET_PRIVATE_KEY
 """
 
 import os
+import json
+import uuid
+import asyncio
+from dataclasses import dataclass, field
 from dotenv import load_dotenv
 load_dotenv()  # Load .env file
 
-from fastapi import FastAPI, BackgroundTasks, HTTPException
+from fastapi import FastAPI, HTTPException
 from fastapi.staticfiles import StaticFiles
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import FileResponse, StreamingResponse
 from pydantic import BaseModel
 from agent.scientist import SovereignScientist
 
 
 # ── State ────────────────────────────────────────────
-agent: SovereignScientist | None = None
-current_run: dict | None = None
-run_status: str = "idle"  # idle | running | complete | error
-run_error: str = ""
-current_milestone: str = ""
-completed_milestones: list = []
+# Pipelines beyond this limit wait in "queued" until a slot frees up
+MAX_CONCURRENT_RUNS = int(os.environ.get("MAX_CONCURRENT_RUNS", "4"))
+# Topics per /api/start_batch call, and the API request rate a batch may use
+MAX_BATCH_SIZE = int(os.environ.get("MAX_BATCH_SIZE", "20"))
+BATCH_RPM = int(os.environ.get("BATCH_RPM", "60"))
+# Finished runs kept for status/results/verify; the oldest are dropped first
+MAX_FINISHED_RUNS = int(os.environ.get("MAX_FINISHED_RUNS", "50"))
+
+
+class EventLog:
+    """
+    Append-only event history for SSE. Every subscriber replays it from the
+    start with its own cursor, so extra tabs and reconnects see every event,
+    and nothing is consumed or left queued for a reader that never comes.
+    """
+
+    def __init__(self):
+        self.items: list = []
+        self.closed = False
+        self._changed = asyncio.Event()
+
+    def append(self, item):
+        self.items.append(item)
+        self._notify()
+
+    def close(self):
+        self.closed = True
+        self._notify()
+
+    def _notify(self):
+        self._changed.set()
+        self._changed = asyncio.Event()
+
+    async def follow(self):
+        """Yield every item, past and future, until the log is closed."""
+        cursor = 0
+        while True:
+            changed = self._changed
+            while cursor < len(self.items):
+                yield self.items[cursor]
+                cursor += 1
+            if self.closed:
+                return
+            await changed.wait()
+
+
+@dataclass
+class RunState:
+    """
+    One research run. Runs are independent, so several can be in flight.
+    All pipelines are coroutines on the server's event loop, so state is
+    only ever touched from one thread and needs no lock.
+    """
+    agent: SovereignScientist
+    topic: str
+    fast: bool = False
+    status: str = "queued"  # queued | running | complete | error
+    milestone: str = "STARTING"
+    completed: list = field(default_factory=list)
+    result: dict | None = None
+    error: str = ""
+    stream: EventLog = field(default_factory=EventLog)  # live output chunks
+    audit: EventLog = field(default_factory=EventLog)  # log rows of new entries
+
+    def advance(self, ms: str):
+        """Move to milestone `ms`, marking the current one completed."""
+        current = self.milestone
+        if current and current not in ("STARTING", "DONE", "ERROR"):
+            if current not in self.completed:
+                self.completed.append(current)
+        self.milestone = ms
+        if ms == "DONE":
+            for m in ["M1_IDEATION", "M2_DESIGN", "M3_ANALYSIS", "M4_WRITING"]:
+                if m not in self.completed:
+                    self.completed.append(m)
+
+    def finish(self, result: dict | None = None, error: str = ""):
+        if error:
+            self.status = "error"
+            self.error = error
+            self.milestone = "ERROR"
+        else:
+            self.status = "complete"
+            self.result = result
+        self.stream.close()
+        self.audit.close()
+
+
+RUNS: dict[str, RunState] = {}
+run_slots = asyncio.Semaphore(MAX_CONCURRENT_RUNS)
+run_tasks: set[asyncio.Task] = set()  # strong refs so running tasks aren't GC'd
+
+
+def log_row(e) -> dict:
+    """Dashboard summary of one AuditEntry."""
+    return {
+        "step_id": e.step_id,
+        "milestone": e.milestone,
+        "action": e.action,
+        "prompt_hash": e.prompt_hash[:16] + "...",
+        "output_hash": e.output_hash[:16] + "...",
+        "output_preview": e.full_output[:200],
+        "timestamp": e.timestamp,
+        "verified": e.verified,
+        "verification_match": e.verification_match,
+    }
+
+
+def register_run(run_id: str, state: RunState):
+    """Add a run, dropping the oldest finished runs beyond MAX_FINISHED_RUNS."""
+    RUNS[run_id] = state
+    state.agent.on_entry = lambda entry: state.audit.append(log_row(entry))
+    finished = [rid for rid, r in RUNS.items() if r.status in ("complete", "error")]
+    for rid in finished[:max(0, len(finished) - MAX_FINISHED_RUNS)]:
+        del RUNS[rid]
+
+
+def get_run(run_id: str) -> RunState:
+    state = RUNS.get(run_id)
+    if state is None:
+        raise HTTPException(404, f"Run {run_id} not found")
+    return state
 
 
 # ── App ──────────────────────────────────────────────
@@ -45,38 +166,70 @@ class StartRequest(BaseModel):
     topic: str
     seed: int = 42
     num_hypotheses: int = 3
+    # One generation for the whole program instead of the milestone chain
+    fast: bool = False
+
+
+class BatchRequest(BaseModel):
+    topics: list[str]
+    seed: int = 42
+    max_concurrency: int = 2
 
 
 # ── Pipeline Runner ──────────────────────────────────
-def run_pipeline_sync(topic: str):
-    global current_run, run_status, run_error, current_milestone, completed_milestones
+async def run_pipeline_async(run_id: str):
+    state = RUNS[run_id]
+
+    def on_stream(action: str, chunk: str):
+        state.stream.append({"action": action, "text": chunk})
+
+    async with run_slots:
+        state.status = "running"
+        try:
+            if state.fast:
+                result = await state.agent.arun_pipeline_fast(
+                    state.topic, on_milestone=state.advance
+                )
+            else:
+                result = await state.agent.arun_pipeline(
+                    state.topic, on_milestone=state.advance, on_stream=on_stream
+                )
+            state.finish(result)
+        except Exception as e:
+            state.finish(error=str(e))
+        finally:
+            state.agent.close_audit()
+            await state.agent.client.aclose()
+
+
+async def run_batch_async(parent: SovereignScientist, run_ids: list[str], max_concurrency: int):
+    states = [RUNS[run_id] for run_id in run_ids]
+
+    def on_milestone(i: int, ms: str):
+        states[i].status = "running"
+        states[i].advance(ms)
+
+    def on_result(i: int, result: dict):
+        states[i].finish(result, error=result.get("error", ""))
+
     try:
-        def on_milestone(ms: str):
-            global current_milestone, completed_milestones
-            if current_milestone and current_milestone not in ("STARTING", "DONE", "ERROR"):
-                if current_milestone not in completed_milestones:
-                    completed_milestones.append(current_milestone)
-            current_milestone = ms
-            if ms == "DONE":
-                for m in ["M1_IDEATION", "M2_DESIGN", "M3_ANALYSIS", "M4_WRITING"]:
-                    if m not in completed_milestones:
-                        completed_milestones.append(m)
-
-        result = agent.run_pipeline(topic, on_milestone=on_milestone)
-        current_run = result
-        run_status = "complete"
-    except Exception as e:
-        run_status = "error"
-        run_error = str(e)
-        current_milestone = "ERROR"
+        await parent.arun_pipeline_many(
+            [s.topic for s in states],
+            max_concurrency=max_concurrency,
+            rpm=BATCH_RPM,
+            agents=[s.agent for s in states],
+            on_milestone=on_milestone,
+            on_result=on_result,
+            run_slots=run_slots,
+        )
+    finally:
+        await parent.client.aclose()
 
 
 # ── API Endpoints ────────────────────────────────────
 
 @app.post("/api/start")
-async def start_research(req: StartRequest, background_tasks: BackgroundTasks):
-    global agent, run_status, run_error, current_run, current_milestone, completed_milestones
-
+async def start_research(req: StartRequest):
     wallet_address = os.environ.get("WALLET_ADDRESS", "")
     private_key = os.environ.get("WALLET_PRIVATE_KEY", "")
 
@@ -87,71 +240,160 @@ async def start_research(req: StartRequest, background_tasks: BackgroundTasks):
             "Get free tokens at https://determinal.eigenarcade.com"
         )
 
-    agent = SovereignScientist(
+    run_id = uuid.uuid4().hex
+    # Off the loop: construction authenticates with a blocking HTTP call
+    agent = await asyncio.to_thread(
+        SovereignScientist,
         wallet_address=wallet_address,
         private_key=private_key,
         seed=req.seed,
+        run_id=run_id,
     )
-    run_status = "running"
-    run_error = ""
-    current_run = None
-    current_milestone = "STARTING"
-    completed_milestones = []
+    register_run(run_id, RunState(agent=agent, topic=req.topic, fast=req.fast))
 
-    background_tasks.add_task(run_pipeline_sync, req.topic)
+    task = asyncio.create_task(run_pipeline_async(run_id))
+    run_tasks.add(task)
+    task.add_done_callback(run_tasks.discard)
 
     return {
         "status": "started",
+        "run_id": run_id,
         "topic": req.topic,
         "seed": req.seed,
         "model": agent.model,
     }
 
 
-@app.get("/api/status")
-async def get_status():
-    log_entries = []
-    if agent:
-        for e in agent.audit_log:
-            log_entries.append({
-                "step_id": e.step_id,
-                "milestone": e.milestone,
-                "action": e.action,
-                "prompt_hash": e.prompt_hash[:16] + "...",
-                "output_hash": e.output_hash[:16] + "...",
-                "output_preview": e.output_preview[:200],
-                "timestamp": e.timestamp,
-                "verified": e.verified,
-                "verification_match": e.verification_match,
-            })
+@app.post("/api/start_batch")
+async def start_batch(req: BatchRequest):
+    """
+    One run per topic, at most max_concurrency (capped at MAX_CONCURRENT_RUNS)
+    at a time. Each topic also holds one of the server-wide run slots, so
+    batches and single runs together stay within MAX_CONCURRENT_RUNS. The
+    runs share one client and audit under audit/{batch_id}/.
+    """
+    wallet_address = os.environ.get("WALLET_ADDRESS", "")
+    private_key = os.environ.get("WALLET_PRIVATE_KEY", "")
+
+    if not wallet_address or not private_key:
+        raise HTTPException(
+            400,
+            "WALLET_ADDRESS and WALLET_PRIVATE_KEY env vars required. "
+            "Get free tokens at https://determinal.eigenarcade.com"
+        )
+    if not req.topics:
+        raise HTTPException(400, "topics must not be empty")
+    if len(req.topics) > MAX_BATCH_SIZE:
+        raise HTTPException(400, f"At most {MAX_BATCH_SIZE} topics per batch")
+
+    batch_id = uuid.uuid4().hex
+    run_ids = [uuid.uuid4().hex for _ in req.topics]
+
+    def build_agents() -> tuple[SovereignScientist, list[SovereignScientist]]:
+        parent = SovereignScientist(
+            wallet_address=wallet_address,
+            private_key=private_key,
+            seed=req.seed,
+            audit_namespace=batch_id,
+        )
+        agents = [
+            parent.spawn(f"topic_{i:03d}", run_id=run_id)
+            for i, run_id in enumerate(run_ids)
+        ]
+        return parent, agents
+
+    # Off the loop: construction authenticates with a blocking HTTP call
+    parent, agents = await asyncio.to_thread(build_agents)
+    for run_id, agent, topic in zip(run_ids, agents, req.topics):
+        register_run(run_id, RunState(agent=agent, topic=topic))
+
+    max_concurrency = max(1, min(req.max_concurrency, MAX_CONCURRENT_RUNS))
+    task = asyncio.create_task(run_batch_async(parent, run_ids, max_concurrency))
+    run_tasks.add(task)
+    task.add_done_callback(run_tasks.discard)
+
+    return {
+        "status": "started",
+        "batch_id": batch_id,
+        "run_ids": run_ids,
+        "topics": req.topics,
+        "seed": req.seed,
+        "model": parent.model,
+    }
+
+
+@app.get("/api/status/{run_id}")
+async def get_status(run_id: str, log: bool = True):
+    """
+    Run progress. ?log=false skips the audit log rows for clients that
+    follow /api/audit/{run_id}/stream instead.
+    """
+    state = get_run(run_id)
+    audit_log = state.agent.audit_log
 
     return {
-        "status": run_status,
-        "current_milestone": current_milestone,
-        "completed_milestones": completed_milestones,
-        "error": run_error if run_status == "error" else None,
-        "steps_completed": len(log_entries),
-        "audit_log": log_entries,
+        "run_id": run_id,
+        "status": state.status,
+        "current_milestone": state.milestone,
+        "completed_milestones": state.completed,
+        "error": state.error if state.status == "error" else None,
+        "steps_completed": len(audit_log),
+        "audit_log": [log_row(e) for e in audit_log] if log else None,
     }
 
 
-@app.get("/api/results")
-async def get_results():
-    if not current_run:
+@app.get("/api/stream/{run_id}")
+async def stream_output(run_id: str):
+    """
+    Server-sent events with live output from the long-form steps
+    (generate_code, write_abstract). Ends with a `done` event.
+    """
+    events = get_run(run_id).stream
+
+    async def sse():
+        async for event in events.follow():
+            yield f"data: {json.dumps(event)}\n\n"
+        yield "event: done\ndata: {}\n\n"
+
+    return StreamingResponse(sse(), media_type="text/event-stream")
+
+
+@app.get("/api/audit/{run_id}/stream")
+async def stream_audit(run_id: str):
+    """
+    Server-sent events with one log row per audit entry as it is recorded,
+    from the start of the run. Ends with a `done` event.
+    """
+    rows = get_run(run_id).audit
+
+    async def sse():
+        async for row in rows.follow():
+            yield f"data: {json.dumps(row)}\n\n"
+        yield "event: done\ndata: {}\n\n"
+
+    return StreamingResponse(sse(), media_type="text/event-stream")
+
+
+@app.get("/api/results/{run_id}")
+async def get_results(run_id: str):
+    state = get_run(run_id)
+    if not state.result:
         raise HTTPException(404, "No results yet")
-    return current_run
+    return state.result
 
 
-@app.post("/api/verify/{step_id}")
-async def verify_step(step_id: str):
+@app.post("/api/verify/{run_id}/{step_id}")
+def verify_step(run_id: str, step_id: str, force: bool = False):
     """
     THE MONEY SHOT: Re-execute a step on EigenAI.
     Determinism guarantee: same input + seed = same output hash.
-    """
-    if not agent:
-        raise HTTPException(400, "No agent initialized")
 
-    result = agent.verify_step(step_id)
+    A step that already verified returns its stored proof; ?force=true
+    re-executes anyway (honest-verifier mode for auditors).
+
+    Plain def: the blocking re-execution runs on the threadpool, not the loop.
+    """
+    result = get_run(run_id).agent.verify_step(step_id, force=force)
 
     if "error" in result:
         raise HTTPException(404, result["error"])
@@ -159,21 +401,23 @@ async def verify_step(step_id: str):
     return result
 
 
-@app.get("/api/audit")
-async def get_full_audit():
-    if not agent:
-        return {"audit_log": []}
-    return {"audit_log": agent.get_audit_log()}
+@app.get("/api/audit/{run_id}")
+async def get_full_audit(run_id: str):
+    """Full audit trail as NDJSON, streamed straight from the append-only file."""
+    agent = get_run(run_id).agent
+    if not agent.audit_path or not os.path.exists(agent.audit_path):
+        raise HTTPException(404, "No audit log yet")
+    return FileResponse(agent.audit_path, media_type="application/x-ndjson")
 
 
 @app.get("/api/health")
 async def health():
-    return {"status": "ok", "agent_ready": agent is not None}
+    running = sum(1 for r in RUNS.values() if r.status == "running")
+    queued = sum(1 for r in RUNS.values() if r.status == "queued")
+    return {"status": "ok", "runs": len(RUNS), "running": running, "queued": queued}
 
 
 # ── Serve Frontend ───────────────────────────────────
-from fastapi.responses import FileResponse
-
 @app.get("/app")
 async def serve_app():
     return FileResponse("frontend/app.html")
@@ -1,30 +1,104 @@
 """
 Quick test: run the pipeline locally to verify everything works.
-Set EIGENAI_API_KEY env var before running.
+Set WALLET_ADDRESS and WALLET_PRIVATE_KEY env vars before running.
 
 Usage:
-  export EIGENAI_API_KEY=your_key
+  export WALLET_ADDRESS=0x...
+  export WALLET_PRIVATE_KEY=0x...
   python test_local.py
 """
 
+import io
 import os
-import json
+import mmap
 import sys
-from agent.scientist import SovereignScientist
+from dataclasses import asdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+import orjson
+
+
+_BAR = "=" * 60
+
+
+def _banner(title: str) -> str:
+    return f"{_BAR}\n{title}\n{_BAR}"
+
+
+JSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+
+
+def _dump_streamed(f, obj, levels: int = 2, indent: int = 0):
+    """
+    Write obj as indented JSON, encoding the top `levels` of dicts and lists
+    one value at a time so only one section's bytes are in memory at once.
+    The output is the same as orjson.dumps(obj, option=JSON_OPTIONS).
+    """
+    if levels == 0 or not isinstance(obj, (dict, list)) or not obj:
+        data = orjson.dumps(obj, option=JSON_OPTIONS)
+        f.write(data.replace(b"\n", b"\n" + b" " * indent) if indent else data)
+        return
+    pad = b" " * (indent + 2)
+    is_dict = isinstance(obj, dict)
+    f.write(b"{\n" if is_dict else b"[\n")
+    for i, item in enumerate(obj.items() if is_dict else obj):
+        if i:
+            f.write(b",\n")
+        f.write(pad)
+        if is_dict:
+            key, item = item
+            f.write(orjson.dumps(str(key)) + b": ")
+        _dump_streamed(f, item, levels - 1, indent + 2)
+    f.write(b"\n" + b" " * indent + (b"}" if is_dict else b"]"))
+
+
+RESULTS_PATH = "test_results.json"
+
+
+def _save_results(path: str, result: dict):
+    with open(path, "wb") as f:
+        _dump_streamed(f, result)
+
+
+def _load_results(path: str) -> dict:
+    """
+    Read back a saved run. orjson parses straight from the mapped page
+    cache, without copying the file into a bytes object first.
+    """
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            raise ValueError(f"{path} is empty")
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            with memoryview(mm) as view:
+                return orjson.loads(view)
+
+
+@lru_cache(maxsize=1)
+def _credentials() -> tuple[str, str]:
+    """deTERMinal wallet credentials, read from the environment once."""
+    return (
+        os.environ.get("WALLET_ADDRESS", ""),
+        os.environ.get("WALLET_PRIVATE_KEY", ""),
+    )
 
 
 def main():
-    key = os.environ.get("EIGENAI_API_KEY")
-    if not key:
-        print("ERROR: Set EIGENAI_API_KEY environment variable")
-        print("Get free credits at: https://determinal.eigenarcade.com")
+    # Imported here so importing this module doesn't load the agent stack
+    from agent.scientist import SovereignScientist
+
+    wallet_address, private_key = _credentials()
+    if not wallet_address or not private_key:
+        print("ERROR: Set WALLET_ADDRESS and WALLET_PRIVATE_KEY environment variables")
+        print("Get free tokens at: https://determinal.eigenarcade.com")
         sys.exit(1)
 
-    print("=" * 60)
-    print("Sovereign AI Scientist — Local Test")
-    print("=" * 60)
+    print(_banner("Sovereign AI Scientist — Local Test"))
 
-    agent = SovereignScientist(eigenai_key=key, seed=42)
+    agent = SovereignScientist(
+        wallet_address=wallet_address,
+        private_key=private_key,
+        seed=42,
+    )
 
     # Use a focused RL topic (your area of expertise)
     topic = (
@@ -38,51 +112,79 @@ def main():
     print("\n--- Running pipeline ---\n")
 
     def on_milestone(ms):
-        print(f"  >> Milestone: {ms}")
+        # One write per event; there are only five, and they are the progress
+        sys.stdout.write(f"  >> Milestone: {ms}\n")
 
     result = agent.run_pipeline(topic, on_milestone=on_milestone)
 
-    # Print summary
-    print("\n" + "=" * 60)
-    print("PIPELINE COMPLETE")
-    print("=" * 60)
+    # Plain dicts of the audit trail, taken once: the encoder then only
+    # sees JSON-native types and never calls back into Python
+    result["audit_log"] = [asdict(e) for e in agent.audit_log]
+
+    # Save full results in the background right away: the write overlaps
+    # the summary output and the verification re-execution below
+    pool = ThreadPoolExecutor(max_workers=1)
+    saved = pool.submit(_save_results, RESULTS_PATH, result)
+
+    # Print summary — buffered and written in one go
+    out = io.StringIO()
+    print("\n" + _banner("PIPELINE COMPLETE"), file=out)
 
     provenance = result.get("provenance", {})
-    print(f"Total verifiable steps: {provenance.get('total_steps', 0)}")
-    print(f"Model: {result['program']['model']}")
-    print(f"Seed: {result['program']['seed']}")
+    program = result["program"]
+    milestones = result["milestones"]
+    print(f"Total verifiable steps: {provenance.get('total_steps', 0)}", file=out)
+    print(f"Model: {program['model']}", file=out)
+    print(f"Seed: {program['seed']}", file=out)
 
     # Show hypotheses
-    m1 = result["milestones"]["M1_IDEATION"]
-    print(f"\nHypotheses generated: {len(m1.get('hypotheses', []))}")
-    for i, h in enumerate(m1.get("hypotheses", [])):
-        title = h.get("title", f"Hypothesis {i+1}")
-        print(f"  {i+1}. {title}")
+    m1 = milestones["M1_IDEATION"]
+    hypotheses = m1.get("hypotheses") or []
+    lines = [f"\nHypotheses generated: {len(hypotheses)}"]
+    lines.extend(
+        f"  {i+1}. {h.get('title', f'Hypothesis {i+1}')}"
+        for i, h in enumerate(hypotheses)
+    )
+    print("\n".join(lines), file=out)
 
     # Show selected hypothesis
     selected = m1.get("selected", {})
-    print(f"\nSelected: {selected.get('title', '—')}")
+    print(f"\nSelected: {selected.get('title', '—')}", file=out)
 
     # Show abstract
-    m4 = result["milestones"]["M4_WRITING"]
+    m4 = milestones["M4_WRITING"]
     abstract = m4.get("abstract", "")
-    print(f"\nAbstract preview:\n{abstract[:300]}...")
-
-    # Test verification
-    print("\n--- Testing Verification ---\n")
-    if agent.audit_log:
-        first_step = agent.audit_log[0].step_id
-        print(f"Verifying step: {first_step}")
-        vresult = agent.verify_step(first_step)
-        print(f"  Original hash:  {vresult.get('original_hash', '—')[:32]}...")
-        print(f"  Re-exec hash:   {vresult.get('verification_hash', '—')[:32]}...")
-        print(f"  Match:           {vresult.get('match', '—')}")
-        print(f"  Status:          {vresult.get('status', '—')}")
-
-    # Save full results
-    with open("test_results.json", "w") as f:
-        json.dump(result, f, indent=2, default=str)
-    print("\nFull results saved to test_results.json")
+    # str slicing already copies at most 300 characters; only the short
+    # case can skip the copy (and shouldn't claim to be truncated)
+    if len(abstract) > 300:
+        abstract = abstract[:300] + "..."
+    print(f"\nAbstract preview:\n{abstract}", file=out)
+    sys.stdout.write(out.getvalue())
+
+    # Test verification — the results file is still being written meanwhile
+    step_ids = [e.step_id for e in agent.audit_log]
+    print(f"\n--- Testing Verification ---\n\nVerifying {len(step_ids)} steps")
+    vresults = agent.verify_steps_batch(step_ids)
+    # Steps that already verified in an earlier run come back from the
+    # agent's persistent proof store without re-executing
+    sys.stdout.write("".join(
+        f"  {v['step_id']:<18} {v.get('original_hash', '—')[:32]}... "
+        f"{v.get('status', v.get('error', '—'))}"
+        f"{' (stored proof)' if v.get('cache') == 'hit' else ''}\n"
+        for v in vresults
+    ))
+    mismatched = [v["step_id"] for v in vresults if not v.get("match")]
+
+    saved.result()
+    pool.shutdown()
+    if _load_results(RESULTS_PATH) != result:
+        print(f"\n✗ {RESULTS_PATH} does not round-trip to the pipeline result")
+        sys.exit(1)
+    print(f"\nFull results saved to {RESULTS_PATH} (re-loaded and checked)")
+
+    if mismatched:
+        print(f"\n✗ Verification failed for: {', '.join(mismatched)}")
+        sys.exit(1)
 
     print("\n✓ All tests passed. Ready to deploy!")
 